@@ -1,7 +1,36 @@
-from importlib.metadata import version
+from .flatten_dict import flatten, unflatten, unflatten_records  # noqa: F401
 
-from .flatten_dict import flatten, unflatten  # noqa: F401
+__all__ = [
+    "flatten",
+    "unflatten",
+    "unflatten_records",
+    "aflatten",
+    "aunflatten",
+    "splitter",
+]
 
-__all__ = ["flatten", "unflatten", "splitter"]
+# These attributes are resolved on first access to keep `import flatten_dict` cheap:
+# `importlib.metadata` scans the installed distributions and `asyncio` is heavy.
+_LAZY_ATTRIBUTES = {
+    "aflatten": ".async_flatten_dict",
+    "aunflatten": ".async_flatten_dict",
+}
 
-__version__ = version("flatten-dict")
+
+def __getattr__(name):
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("flatten-dict")
+    elif name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"__version__"})
@@ -0,0 +1,163 @@
+import asyncio
+import functools
+from collections.abc import Mapping
+
+from .flatten_dict import SPLITTER_DICT, _iter_flatten, flatten, nested_set_dict
+
+DEFAULT_YIELD_EVERY = 1000
+
+
+async def _aiter(iterable):
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+def _count_items(d, enumerate_types, limit):
+    """Count the items in `d` and its nested flattenable values, up to `limit`."""
+    flattenable_types = (Mapping,) + enumerate_types
+    count = 0
+    stack = [d]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, enumerate_types):
+            if iter(node) is node:
+                # iterators cannot be traversed twice
+                continue
+            values = node
+        else:
+            values = node.values()
+        for value in values:
+            count += 1
+            if count >= limit:
+                return count
+            if isinstance(value, flattenable_types):
+                stack.append(value)
+    return count
+
+
+async def aflatten(
+    records,
+    reducer="tuple",
+    inverse=False,
+    max_flatten_depth=None,
+    enumerate_types=(),
+    keep_empty_types=(),
+    yield_every=DEFAULT_YIELD_EVERY,
+    offload_threshold=None,
+    executor=None,
+    sizeof=None,
+):
+    """Flatten each `Mapping` object from an (async) iterable without blocking the loop.
+
+    Parameters
+    ----------
+    records : AsyncIterable or Iterable of dict-like objects
+        The dicts that will be flattened.
+    reducer, inverse, max_flatten_depth, enumerate_types, keep_empty_types
+        Same as `flatten()`.
+    yield_every : int
+        Yield control to the event loop after this many flattened items.
+        The counter is shared across the records.
+    offload_threshold : Optional[int]
+        If given, the records whose size is not less than this threshold are flattened
+        by `flatten()` in `executor` instead of in the event loop.
+    executor : Optional[concurrent.futures.Executor]
+        The executor used for offloading. The default executor of the event loop is
+        used if it is `None`. A `ProcessPoolExecutor` requires picklable records and
+        reducer.
+    sizeof : Optional[Callable]
+        The function used to measure a record for `offload_threshold`. By default, the
+        size is the number of items in the record and in its nested flattenable
+        values (iterators are not counted), and counting stops at
+        `offload_threshold`, so measuring a record costs at most that many steps.
+
+    Yields
+    ------
+    flat_dict : dict
+        The flattened record, in the same order as `records`.
+    """
+    if yield_every < 1:
+        raise ValueError("yield_every should not be less than 1.")
+    enumerate_types = tuple(enumerate_types)
+    flatten_kwargs = {
+        "reducer": reducer,
+        "inverse": inverse,
+        "max_flatten_depth": max_flatten_depth,
+        "enumerate_types": enumerate_types,
+        "keep_empty_types": keep_empty_types,
+    }
+    if sizeof is None:
+
+        def sizeof(record):
+            return _count_items(record, enumerate_types, offload_threshold)
+
+    flattenable_types = (Mapping,) + enumerate_types
+    budget = yield_every
+    async for record in _aiter(records):
+        # the records that cannot be flattened are left to `_iter_flatten()`, which
+        # raises the same `ValueError` as `flatten()`
+        if (
+            offload_threshold is not None
+            and isinstance(record, flattenable_types)
+            and sizeof(record) >= offload_threshold
+        ):
+            loop = asyncio.get_running_loop()
+            yield await loop.run_in_executor(
+                executor, functools.partial(flatten, record, **flatten_kwargs)
+            )
+            continue
+
+        flat_dict = {}
+        for flat_key, value in _iter_flatten(record, **flatten_kwargs):
+            if flat_key in flat_dict:
+                raise ValueError("duplicated key '{}'".format(flat_key))
+            flat_dict[flat_key] = value
+            budget -= 1
+            if budget <= 0:
+                await asyncio.sleep(0)
+                budget = yield_every
+        yield flat_dict
+
+
+async def aunflatten(
+    pairs, splitter="tuple", inverse=False, yield_every=DEFAULT_YIELD_EVERY
+):
+    """Unflatten an (async) stream of flat items without blocking the loop.
+
+    Parameters
+    ----------
+    pairs : AsyncIterable or Iterable of (flat_key, value), or dict-like object
+        The flat items that will be unflattened.
+    splitter, inverse
+        Same as `unflatten()`.
+    yield_every : int
+        Yield control to the event loop after this many items.
+
+    Returns
+    -------
+    unflattened_dict : dict
+    """
+    if yield_every < 1:
+        raise ValueError("yield_every should not be less than 1.")
+    if isinstance(splitter, str):
+        splitter = SPLITTER_DICT[splitter]
+    if isinstance(pairs, Mapping):
+        pairs = pairs.items()
+
+    unflattened_dict = {}
+    budget = yield_every
+    async for flat_key, value in _aiter(pairs):
+        if inverse:
+            flat_key, value = value, flat_key
+        key_tuple = splitter(flat_key)
+        nested_set_dict(unflattened_dict, key_tuple, value)
+        budget -= 1
+        if budget <= 0:
+            await asyncio.sleep(0)
+            budget = yield_every
+
+    return unflattened_dict
@@ -1,21 +1,23 @@
-import inspect
 from collections.abc import Mapping
+from weakref import WeakKeyDictionary
 
-from .reducers import dot_reducer, path_reducer, tuple_reducer, underscore_reducer
-from .splitters import dot_splitter, path_splitter, tuple_splitter, underscore_splitter
+from .reducers import DelimiterReducer, Reducer, path_reducer, tuple_reducer
+from .splitters import DelimiterSplitter, path_splitter, tuple_splitter
 
+# the delimiter-based entries are equivalent to `dot_reducer`, `underscore_reducer`,
+# `dot_splitter` and `underscore_splitter`, but allow faster traversal in `flatten()`
 REDUCER_DICT = {
     "tuple": tuple_reducer,
     "path": path_reducer,
-    "dot": dot_reducer,
-    "underscore": underscore_reducer,
+    "dot": DelimiterReducer("."),
+    "underscore": DelimiterReducer("_"),
 }
 
 SPLITTER_DICT = {
     "tuple": tuple_splitter,
     "path": path_splitter,
-    "dot": dot_splitter,
-    "underscore": underscore_splitter,
+    "dot": DelimiterSplitter("."),
+    "underscore": DelimiterSplitter("_"),
 }
 
 
@@ -35,7 +37,10 @@ def flatten(
         The dict that will be flattened.
     reducer : {'tuple', 'path', 'underscore', 'dot', Callable}
         The key joining method. If a `Callable` is given, the `Callable` will be
-        used to reduce.
+        used to reduce. A `flatten_dict.reducers.Reducer` object declares its arity
+        up front, and a `flatten_dict.reducers.DelimiterReducer` (but not its
+        subclasses, which may override ``__call__``) is applied by prepending a
+        per-level prefix instead of calling it for every key.
         'tuple': The resulting key will be tuple of the original keys.
         'path': Use `os.path.join` to join keys.
         'underscore': Use underscores to join keys.
@@ -62,6 +67,96 @@ def flatten(
     -------
     flat_dict : dict
     """
+    (
+        reducer,
+        reducer_accepts_parent_obj,
+        delimiter_reducer,
+        enumerate_types,
+        flattenable_types,
+    ) = _prepare_flatten(d, reducer, max_flatten_depth, enumerate_types)
+    flat_dict = {}
+
+    # this is the same traversal as `_iter_flatten()`, kept as a plain recursion
+    # because consuming the generator makes `flatten()` noticeably slower
+    def _flatten(_d, depth, parent=None):
+        key_value_iterable = (
+            enumerate(_d) if isinstance(_d, enumerate_types) else _d.items()
+        )
+        if delimiter_reducer is None or parent is None:
+            prefix = None
+        else:
+            prefix = delimiter_reducer.prefix(parent)
+        has_item = False
+        for key, value in key_value_iterable:
+            has_item = True
+            if prefix is not None:
+                flat_key = prefix + delimiter_reducer.escape_key(key)
+            elif reducer_accepts_parent_obj:
+                flat_key = reducer(parent, key, _d)
+            else:
+                flat_key = reducer(parent, key)
+            if isinstance(value, flattenable_types) and (
+                max_flatten_depth is None or depth < max_flatten_depth
+            ):
+                # recursively build the result
+                has_child = _flatten(value, depth=depth + 1, parent=flat_key)
+                if has_child or not isinstance(value, keep_empty_types):
+                    # ignore the key in this level because it already has child key
+                    # or its value is empty
+                    continue
+
+            # add an item to the result
+            if inverse:
+                flat_key, value = value, flat_key
+            if flat_key in flat_dict:
+                raise ValueError("duplicated key '{}'".format(flat_key))
+            flat_dict[flat_key] = value
+
+        return has_item
+
+    _flatten(d, depth=1)
+    return flat_dict
+
+
+# weakly keyed, so caching does not keep short-lived reducers (e.g., lambdas) alive
+_REDUCER_ACCEPTS_PARENT_OBJ_CACHE = WeakKeyDictionary()
+
+
+def _reducer_accepts_parent_obj(reducer):
+    """Check whether `reducer` takes the parent object as its third argument.
+
+    The result is cached by reducer because `inspect.signature` is slow compared to
+    flattening a small dict.
+    """
+    try:
+        return _REDUCER_ACCEPTS_PARENT_OBJ_CACHE[reducer]
+    except (KeyError, TypeError):
+        # TypeError: unhashable or not weakly referenceable
+        pass
+
+    import inspect
+
+    accepts_parent_obj = len(inspect.signature(reducer).parameters) == 3
+    try:
+        _REDUCER_ACCEPTS_PARENT_OBJ_CACHE[reducer] = accepts_parent_obj
+    except TypeError:
+        pass
+    return accepts_parent_obj
+
+
+def _prepare_flatten(d, reducer, max_flatten_depth, enumerate_types):
+    """Validate the arguments of `flatten()` and resolve the reducer.
+
+    Returns
+    -------
+    reducer : Callable
+    reducer_accepts_parent_obj : bool
+    delimiter_reducer : Optional[DelimiterReducer]
+        `reducer` itself if it is exactly a `DelimiterReducer`, so the traversal can
+        build the keys from a prefix shared by the keys at the same level.
+    enumerate_types : tuple
+    flattenable_types : tuple
+    """
     enumerate_types = tuple(enumerate_types)
     flattenable_types = (Mapping,) + enumerate_types
     if not isinstance(d, flattenable_types):
@@ -76,41 +171,83 @@ def flatten(
 
     if isinstance(reducer, str):
         reducer = REDUCER_DICT[reducer]
-    reducer_accepts_parent_obj = len(inspect.signature(reducer).parameters) == 3
-    flat_dict = {}
+    if isinstance(reducer, Reducer):
+        reducer_accepts_parent_obj = reducer.accepts_parent_obj
+    else:
+        reducer_accepts_parent_obj = _reducer_accepts_parent_obj(reducer)
+    # subclasses may override `__call__`, so they are always called
+    delimiter_reducer = reducer if type(reducer) is DelimiterReducer else None
+    return (
+        reducer,
+        reducer_accepts_parent_obj,
+        delimiter_reducer,
+        enumerate_types,
+        flattenable_types,
+    )
 
-    def _flatten(_d, depth, parent=None):
+
+def _iter_flatten(
+    d,
+    reducer="tuple",
+    inverse=False,
+    max_flatten_depth=None,
+    enumerate_types=(),
+    keep_empty_types=(),
+):
+    """Lazily generate the items of ``flatten(d, ...)``.
+
+    The parameters are the same as `flatten()`. The items are generated in the same
+    order as they are inserted by `flatten()`, but duplicated keys are not checked,
+    so the caller can interleave other work (e.g., yielding to an event loop)
+    between the items.
+
+    Yields
+    ------
+    flat_key : Any
+    value : Any
+    """
+    (
+        reducer,
+        reducer_accepts_parent_obj,
+        delimiter_reducer,
+        enumerate_types,
+        flattenable_types,
+    ) = _prepare_flatten(d, reducer, max_flatten_depth, enumerate_types)
+
+    def _iter(_d, depth, parent=None):
         key_value_iterable = (
             enumerate(_d) if isinstance(_d, enumerate_types) else _d.items()
         )
+        if delimiter_reducer is None or parent is None:
+            prefix = None
+        else:
+            prefix = delimiter_reducer.prefix(parent)
         has_item = False
         for key, value in key_value_iterable:
             has_item = True
-            if reducer_accepts_parent_obj:
+            if prefix is not None:
+                flat_key = prefix + delimiter_reducer.escape_key(key)
+            elif reducer_accepts_parent_obj:
                 flat_key = reducer(parent, key, _d)
             else:
                 flat_key = reducer(parent, key)
             if isinstance(value, flattenable_types) and (
                 max_flatten_depth is None or depth < max_flatten_depth
             ):
-                # recursively build the result
-                has_child = _flatten(value, depth=depth + 1, parent=flat_key)
+                has_child = yield from _iter(value, depth=depth + 1, parent=flat_key)
                 if has_child or not isinstance(value, keep_empty_types):
-                    # ignore the key in this level because it already has child key
-                    # or its value is empty
                     continue
 
-            # add an item to the result
             if inverse:
-                flat_key, value = value, flat_key
-            if flat_key in flat_dict:
-                raise ValueError("duplicated key '{}'".format(flat_key))
-            flat_dict[flat_key] = value
+                yield value, flat_key
+            else:
+                yield flat_key, value
 
         return has_item
 
-    _flatten(d, depth=1)
-    return flat_dict
+    # the validation above runs eagerly, only the traversal is lazy;
+    # keep the traversal in sync with `flatten()`
+    return _iter(d, depth=1)
 
 
 def nested_set_dict(d, keys, value):
@@ -165,3 +302,68 @@ def unflatten(d, splitter="tuple", inverse=False):
         nested_set_dict(unflattened_dict, key_tuple, value)
 
     return unflattened_dict
+
+
+def unflatten_records(columns, splitter="tuple", skip_none=False):
+    """Unflatten columns of flat keys into a list of nested records.
+
+    This is equivalent to calling `unflatten()` on each row, but each column name is
+    split only once.
+
+    Parameters
+    ----------
+    columns : Mapping[Any, Sequence]
+        The columns keyed by flat keys. All columns should have the same length.
+        Columns with a ``tolist()`` method (e.g., `array.array` or `numpy.ndarray`)
+        are converted by it.
+    splitter : {'tuple', 'path', 'underscore', 'dot', Callable}
+        The key splitting method, see `unflatten()`.
+    skip_none : bool
+        Whether to skip the cells that are `None`. The nested dicts that become empty
+        are skipped as well.
+
+    Returns
+    -------
+    records : list of dict
+    """
+    if isinstance(splitter, str):
+        splitter = SPLITTER_DICT[splitter]
+
+    # build a nested template whose leaves are column indices
+    template = {}
+    column_lists = []
+    for column_index, (flat_key, column) in enumerate(columns.items()):
+        nested_set_dict(template, splitter(flat_key), column_index)
+        column_lists.append(
+            column.tolist() if hasattr(column, "tolist") else list(column)
+        )
+    if len(set(map(len, column_lists))) > 1:
+        raise ValueError("all columns should have the same length.")
+
+    template = _compile_template(template)
+    return [
+        _fill_template(template, row, skip_none)
+        for row in zip(*column_lists, strict=True)
+    ]
+
+
+def _compile_template(template):
+    return [
+        (key, child if isinstance(child, int) else _compile_template(child))
+        for key, child in template.items()
+    ]
+
+
+def _fill_template(template, row, skip_none):
+    record = {}
+    for key, child in template:
+        if isinstance(child, list):
+            value = _fill_template(child, row, skip_none)
+            if skip_none and not value:
+                continue
+        else:
+            value = row[child]
+            if skip_none and value is None:
+                continue
+        record[key] = value
+    return record
@@ -1,3 +1,8 @@
+from abc import ABC, abstractmethod
+
+from .splitters import DelimiterSplitter, _check_delimiter_and_escape
+
+
 def tuple_reducer(k1, k2):
     if k1 is None:
         return (k2,)
@@ -24,23 +29,100 @@ def underscore_reducer(k1, k2):
     return "{}_{}".format(k1, k2)
 
 
-def make_reducer(delimiter):
+def make_reducer(delimiter, escape=None):
     """Create a reducer with a custom delimiter.
 
     Parameters
     ----------
     delimiter : str
         Delimiter to use to join keys.
+    escape : Optional[str]
+        Escape character, see `DelimiterReducer`.
 
     Returns
     -------
-    f : Callable
+    f : DelimiterReducer
         Callable that can be passed to `flatten()`'s `reducer` argument.
     """
+    return DelimiterReducer(delimiter, escape=escape)
+
+
+class Reducer(ABC):
+    """Abstract base class of reducer objects.
+
+    A reducer object is a callable that can be passed to `flatten()`'s `reducer`
+    argument. Unlike a plain function, it declares its metadata up front, so
+    `flatten()` does not need to inspect it.
+
+    Attributes
+    ----------
+    accepts_parent_obj : bool
+        Whether ``__call__`` takes the parent object as the third argument, i.e.,
+        ``__call__(k1, k2, parent_obj)`` instead of ``__call__(k1, k2)``.
+    splitter : Optional[Callable]
+        The splitter that inverts this reducer in `unflatten()`.
+    """
+
+    accepts_parent_obj = False
+    splitter = None
+
+    @abstractmethod
+    def __call__(self, k1, k2):
+        """Reduce the parent flat key `k1` (`None` at the top level) and the key `k2`."""
+
+
+class DelimiterReducer(Reducer):
+    """Join keys with a delimiter, optionally escaping it in the keys.
+
+    Without `escape`, keys containing the delimiter cannot be split back correctly,
+    e.g., ``{'a.b': 1}`` and ``{'a': {'b': 1}}`` are both flattened to ``{'a.b': 1}``.
+    With `escape`, the escape character and the first character of the delimiter in
+    the keys are prefixed by the escape character, and `splitter` restores the
+    original keys. Escaping the first character instead of the whole delimiter
+    keeps a key ending with a part of a longer delimiter, e.g., ``'a:'`` with
+    ``'::'``, from forming a delimiter with the next one.
+
+    Parameters
+    ----------
+    delimiter : str
+        Delimiter to use to join keys.
+    escape : Optional[str]
+        A single character that escapes the delimiter and itself, e.g., a backslash.
+    """
+
+    def __init__(self, delimiter, escape=None):
+        _check_delimiter_and_escape(delimiter, escape)
+        self.delimiter = delimiter
+        self.escape = escape
+        self.splitter = DelimiterSplitter(delimiter, escape=escape)
+        # `flatten()` calls this on every non-top-level key; `format()` converts the
+        # keys the same way as the `str.format()` in `dot_reducer`
+        self.escape_key = format if escape is None else self._escape_key
+
+    def _escape_key(self, key):
+        return (
+            format(key)
+            .replace(self.escape, self.escape * 2)
+            .replace(self.delimiter[0], self.escape + self.delimiter[0])
+        )
+
+    def prefix(self, k1):
+        """Return the common prefix of the flat keys under the flat key `k1`."""
+        if not isinstance(k1, str):
+            # a top-level key kept as is by `__call__`, which has to be escaped once
+            # it has children
+            k1 = self.escape_key(k1)
+        return "{}{}".format(k1, self.delimiter)
 
-    def f(k1, k2):
+    def __call__(self, k1, k2):
         if k1 is None:
+            # keep the type of the top-level key like `dot_reducer`
+            if self.escape is not None and isinstance(k2, str):
+                return self._escape_key(k2)
             return k2
-        return "{}{}{}".format(k1, delimiter, k2)
+        return self.prefix(k1) + self.escape_key(k2)
 
-    return f
+    def __repr__(self):
+        return "{}({!r}, escape={!r})".format(
+            type(self).__name__, self.delimiter, self.escape
+        )
@@ -1,3 +1,6 @@
+from abc import ABC, abstractmethod
+
+
 def tuple_splitter(flat_key):
     return flat_key
 
@@ -19,22 +22,96 @@ def underscore_splitter(flat_key):
     return keys
 
 
-def make_splitter(delimiter):
-    """Create a reducer with a custom delimiter.
+def make_splitter(delimiter, escape=None):
+    """Create a splitter with a custom delimiter.
 
     Parameters
     ----------
     delimiter : str
         Delimiter to use to split keys.
+    escape : Optional[str]
+        Escape character, see `DelimiterSplitter`.
 
     Returns
     -------
-    f : Callable
+    f : DelimiterSplitter
         Callable that can be passed to ``unflatten``'s ``splitter`` argument.
     """
+    return DelimiterSplitter(delimiter, escape=escape)
+
+
+class Splitter(ABC):
+    """Abstract base class of splitter objects.
+
+    A splitter object is a callable that can be passed to ``unflatten``'s ``splitter``
+    argument.
+    """
+
+    @abstractmethod
+    def __call__(self, flat_key):
+        """Split `flat_key` into a sequence of keys."""
+
+
+class DelimiterSplitter(Splitter):
+    """Split keys on a delimiter, optionally honoring an escape character.
+
+    Parameters
+    ----------
+    delimiter : str
+        Delimiter to use to split keys.
+    escape : Optional[str]
+        A single character that escapes the delimiter and itself, e.g., a backslash.
+        An escape character followed by itself or by the first character of the
+        delimiter stands for the latter, so the keys produced by
+        ``DelimiterReducer(delimiter, escape)`` are split back into the original keys
+        even if they contain the delimiter.
+    """
+
+    def __init__(self, delimiter, escape=None):
+        _check_delimiter_and_escape(delimiter, escape)
+        self.delimiter = delimiter
+        self.escape = escape
+
+    def __call__(self, flat_key):
+        if self.escape is None or self.escape not in flat_key:
+            return tuple(flat_key.split(self.delimiter))
+        return _split_escaped(flat_key, self.delimiter, self.escape)
+
+    def __repr__(self):
+        return "{}({!r}, escape={!r})".format(
+            type(self).__name__, self.delimiter, self.escape
+        )
+
+
+def _check_delimiter_and_escape(delimiter, escape):
+    if not isinstance(delimiter, str) or not delimiter:
+        raise ValueError("delimiter should be a non-empty str.")
+    if escape is not None:
+        if not isinstance(escape, str) or len(escape) != 1:
+            raise ValueError("escape should be a single character.")
+        if escape in delimiter:
+            raise ValueError("escape should not be a part of the delimiter.")
 
-    def f(flat_key):
-        keys = tuple(flat_key.split(delimiter))
-        return keys
 
-    return f
+def _split_escaped(flat_key, delimiter, escape):
+    keys = []
+    chars = []
+    delimiter_len = len(delimiter)
+    i = 0
+    n = len(flat_key)
+    while i < n:
+        if flat_key[i] == escape and i + 1 < n:
+            if flat_key[i + 1] in (escape, delimiter[0]):
+                chars.append(flat_key[i + 1])
+                i += 2
+                continue
+        elif flat_key.startswith(delimiter, i):
+            keys.append("".join(chars))
+            chars = []
+            i += delimiter_len
+            continue
+        # a lone escape character is kept as is
+        chars.append(flat_key[i])
+        i += 1
+    keys.append("".join(chars))
+    return tuple(keys)
@@ -0,0 +1,143 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from flatten_dict import aflatten, aunflatten, flatten, unflatten
+
+
+@pytest.fixture
+def records():
+    return [
+        {"a": "0", "b": {"a": "1.0", "b": "1.1"}},
+        {"c": {"a": "2.0", "b": {"a": "2.1.0", "b": "2.1.1"}}, "d": []},
+        {"e": {}, "f": ["x", {"g": "y"}]},
+    ]
+
+
+async def _agen(items):
+    for item in items:
+        yield item
+
+
+def _run_aflatten(records, **kwargs):
+    async def _collect():
+        return [flat_dict async for flat_dict in aflatten(_agen(records), **kwargs)]
+
+    return asyncio.run(_collect())
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"reducer": "dot"},
+        {"reducer": "path", "max_flatten_depth": 2},
+        {"enumerate_types": (list,), "keep_empty_types": (dict, list)},
+        {"reducer": lambda k1, k2, parent: (k1 or ()) + (type(parent), k2)},
+    ],
+)
+def test_aflatten_matches_flatten(records, kwargs):
+    expected = [flatten(record, **kwargs) for record in records]
+    assert _run_aflatten(records, yield_every=1, **kwargs) == expected
+    assert _run_aflatten(records, offload_threshold=0, **kwargs) == expected
+
+
+def test_aflatten_yields_to_event_loop():
+    record = {str(i): {"x": i} for i in range(10)}
+    ticks = []
+
+    async def _ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def _main():
+        task = asyncio.ensure_future(_ticker())
+        await asyncio.sleep(0)
+        n_ticks_before = len(ticks)
+        result = [flat_dict async for flat_dict in aflatten([record], yield_every=2)]
+        task.cancel()
+        return result, len(ticks) - n_ticks_before
+
+    result, n_ticks = asyncio.run(_main())
+    assert result == [flatten(record)]
+    assert n_ticks >= 5
+
+
+def test_aflatten_offload_to_executor(records):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        result = _run_aflatten(
+            records, reducer="dot", offload_threshold=2, executor=executor
+        )
+    assert result == [flatten(record, reducer="dot") for record in records]
+
+
+def test_aflatten_inverse_with_duplicated_value():
+    with pytest.raises(ValueError):
+        _run_aflatten([{"a": "0", "b": "0"}], inverse=True)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"offload_threshold": 5}, {"offload_threshold": 1, "sizeof": len}]
+)
+def test_aflatten_invalid_record(kwargs):
+    with pytest.raises(ValueError):
+        _run_aflatten([[1, 2]], **kwargs)
+
+
+def test_aflatten_invalid_yield_every(records):
+    with pytest.raises(ValueError):
+        _run_aflatten(records, yield_every=0)
+
+
+@pytest.mark.parametrize("inverse", [False, True])
+def test_aunflatten_matches_unflatten(records, inverse):
+    flat_dict = flatten(records[0], reducer="dot", inverse=inverse)
+    expected = unflatten(flat_dict, splitter="dot", inverse=inverse)
+    pairs = _agen(list(flat_dict.items()))
+    result = asyncio.run(
+        aunflatten(pairs, splitter="dot", inverse=inverse, yield_every=1)
+    )
+    assert result == expected
+    assert asyncio.run(aunflatten(flat_dict, splitter="dot", inverse=inverse)) == (
+        expected
+    )
+
+
+def test_aunflatten_with_duplicated_key():
+    with pytest.raises(ValueError):
+        asyncio.run(aunflatten(_agen([(("a",), 1), (("a",), 2)])))
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.n_submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.n_submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_aflatten_offload_measures_nested_items():
+    records = [
+        {"payload": {str(i): {"x": [i, i]} for i in range(10)}},
+        {"a": 1, "b": {"c": 2}},
+    ]
+    with RecordingExecutor() as executor:
+        result = _run_aflatten(
+            records, offload_threshold=20, executor=executor, enumerate_types=(list,)
+        )
+    assert result == [flatten(record, enumerate_types=(list,)) for record in records]
+    # the 1st record has 41 nested items but only 1 top-level key
+    assert executor.n_submitted == 1
+
+
+def test_aflatten_offload_with_custom_sizeof(records):
+    with RecordingExecutor() as executor:
+        result = _run_aflatten(
+            records, offload_threshold=3, executor=executor, sizeof=len
+        )
+    assert result == [flatten(record) for record in records]
+    assert executor.n_submitted == 0
@@ -1,17 +1,27 @@
+import gc
 import json
 import os.path
+import weakref
+from array import array
+from enum import Enum
 from types import GeneratorType
 
 import pytest
 
-from flatten_dict import flatten, unflatten
+from flatten_dict import flatten, unflatten, unflatten_records
+from flatten_dict.flatten_dict import _iter_flatten
 from flatten_dict.reducers import (
+    DelimiterReducer,
+    Reducer,
+    dot_reducer,
     make_reducer,
     path_reducer,
     tuple_reducer,
     underscore_reducer,
 )
 from flatten_dict.splitters import (
+    DelimiterSplitter,
+    Splitter,
     make_splitter,
     path_splitter,
     tuple_splitter,
@@ -472,3 +482,261 @@ def test_make_splitter(normal_dict, delimiter, delimiter_equivalent):
         unflattened_dict_using_make_splitter
         == unflattened_dict_using_equivalent_splitter
     )
+
+
+def test_flatten_dict_with_unhashable_reducer(normal_dict, flat_tuple_dict):
+    class UnhashableReducer:
+        __hash__ = None
+
+        def __call__(self, k1, k2, parent_obj):
+            return tuple_reducer(k1, k2)
+
+    assert flatten(normal_dict, reducer=UnhashableReducer()) == flat_tuple_dict
+
+
+def test_flatten_dict_reducer_arity_is_cached(normal_dict):
+    from flatten_dict.flatten_dict import _REDUCER_ACCEPTS_PARENT_OBJ_CACHE
+
+    def reducer(k1, k2):
+        return underscore_reducer(k1, k2)
+
+    flatten(normal_dict, reducer=reducer)
+    assert _REDUCER_ACCEPTS_PARENT_OBJ_CACHE[reducer] is False
+    # the cache does not keep the reducer alive
+    reducer_ref = weakref.ref(reducer)
+    del reducer
+    gc.collect()
+    assert reducer_ref() is None
+
+
+def test_flatten_dict_with_non_weakrefable_reducer(normal_dict):
+    class SlotsReducer:
+        __slots__ = ()
+
+        def __call__(self, k1, k2):
+            return tuple_reducer(k1, k2)
+
+    reducer = SlotsReducer()
+    assert flatten(normal_dict, reducer=reducer) == flatten(normal_dict)
+    assert flatten(normal_dict, reducer=reducer) == flatten(normal_dict)
+
+
+@pytest.mark.parametrize("escape", [None, "\\"])
+def test_delimiter_reducer_matches_make_reducer(normal_dict, escape):
+    reducer = DelimiterReducer(".", escape=escape)
+    assert flatten(normal_dict, reducer=reducer) == flatten(normal_dict, "dot")
+    assert flatten({1: {2: 3}, 4: 5}, reducer=reducer) == {"1.2": 3, 4: 5}
+
+
+@pytest.mark.parametrize("delimiter", [".", "::"])
+def test_delimiter_reducer_escape_round_trip(delimiter):
+    d = {
+        "a{}b".format(delimiter): {"c\\": {"\\{}d".format(delimiter): 1}},
+        "a": {"b": {"c": 2}, ":b": 3},
+        "a:": {"b": 4, ":": 5},
+        "e\\": [6],
+    }
+    reducer = make_reducer(delimiter, escape="\\")
+    flat_dict = flatten(d, reducer=reducer)
+    assert len(flat_dict) == 6
+    assert unflatten(flat_dict, splitter=reducer.splitter) == d
+    assert unflatten(flat_dict, splitter=make_splitter(delimiter, "\\")) == d
+
+
+@pytest.mark.parametrize(
+    "flatten_func", [flatten, lambda d, reducer: dict(_iter_flatten(d, reducer))]
+)
+def test_delimiter_reducer_escapes_non_str_top_level_parent(flatten_func):
+    reducer = make_reducer(".", escape="\\")
+    d = {1.5: {"a": 1}, "x": {2.5: 3}, 4.5: 6}
+    flat_dict = flatten_func(d, reducer=reducer)
+    # the top-level leaf keeps its type like `dot_reducer`
+    assert flat_dict == {"1\\.5.a": 1, "x.2\\.5": 3, 4.5: 6}
+    assert reducer(reducer(None, 1.5), "a") == "1\\.5.a"
+    del flat_dict[4.5]
+    assert unflatten(flat_dict, splitter=reducer.splitter) == {
+        "1.5": {"a": 1},
+        "x": {"2.5": 3},
+    }
+
+
+def test_delimiter_reducer_without_escape_is_ambiguous():
+    with pytest.raises(ValueError):
+        flatten({"a.b": 1, "a": {"b": 2}}, reducer=DelimiterReducer("."))
+
+
+def test_delimiter_splitter_keeps_lone_escape():
+    splitter = DelimiterSplitter(".", escape="\\")
+    assert splitter("a\\b.c\\") == ("a\\b", "c\\")
+    assert splitter("a\\\\.b") == ("a\\", "b")
+
+
+@pytest.mark.parametrize(
+    "delimiter, escape", [("", None), (1, None), (".", "ab"), ("\\.", "\\")]
+)
+def test_delimiter_reducer_invalid_arguments(delimiter, escape):
+    with pytest.raises(ValueError):
+        DelimiterReducer(delimiter, escape=escape)
+    with pytest.raises(ValueError):
+        DelimiterSplitter(delimiter, escape=escape)
+
+
+def test_reducer_object_accepts_parent_obj(dict_with_list):
+    class TypeTupleReducer(Reducer):
+        accepts_parent_obj = True
+
+        def __call__(self, k1, k2, parent_obj):
+            return tuple_reducer(k1, (type(parent_obj).__name__, k2))
+
+    flat_dict = flatten(
+        dict_with_list, reducer=TypeTupleReducer(), enumerate_types=(list,)
+    )
+    assert flat_dict[(("dict", "a"),)] == "0"
+    assert flat_dict[(("dict", "c"), ("dict", "b"), ("dict", "b"), ("list", 1))] == (
+        "2.1.1.1"
+    )
+
+
+@pytest.fixture
+def flat_dot_records():
+    return [
+        {"a": "0", "b.a": "1.0", "b.b": "1.1"},
+        {"a": "2", "b.a": None, "b.b": "3.1"},
+        {"a": None, "b.a": None, "b.b": None},
+    ]
+
+
+def _to_columns(records):
+    return {key: [record[key] for record in records] for key in records[0]}
+
+
+def test_unflatten_records(flat_dot_records):
+    columns = _to_columns(flat_dot_records)
+    assert unflatten_records(columns, splitter="dot") == [
+        unflatten(record, splitter="dot") for record in flat_dot_records
+    ]
+
+
+def test_unflatten_records_skip_none(flat_dot_records):
+    columns = _to_columns(flat_dot_records)
+    assert unflatten_records(columns, splitter="dot", skip_none=True) == [
+        {"a": "0", "b": {"a": "1.0", "b": "1.1"}},
+        {"a": "2", "b": {"b": "3.1"}},
+        {},
+    ]
+
+
+def test_unflatten_records_with_arrays():
+    columns = {("a",): array("d", [0.5, 1.5]), ("b", "c"): array("l", [1, 2])}
+    assert unflatten_records(columns) == [
+        {"a": 0.5, "b": {"c": 1}},
+        {"a": 1.5, "b": {"c": 2}},
+    ]
+
+
+def test_unflatten_records_with_numpy():
+    np = pytest.importorskip("numpy")
+    columns = {"a_b": np.arange(3), "a_c": np.array(["x", "y", "z"])}
+    records = unflatten_records(columns, splitter="underscore")
+    assert records[2] == {"a": {"b": 2, "c": "z"}}
+    assert type(records[2]["a"]["b"]) is int
+
+
+def test_unflatten_records_with_duplicated_key():
+    with pytest.raises(ValueError):
+        unflatten_records(
+            {"a.b": [1], "A.B": [2]}, splitter=lambda k: tuple(k.lower().split("."))
+        )
+
+
+def test_unflatten_records_with_different_lengths():
+    with pytest.raises(ValueError):
+        unflatten_records({"a": [1, 2], "b": [1]}, splitter="dot")
+
+
+def test_unflatten_records_without_columns():
+    assert unflatten_records({}) == []
+
+
+@pytest.mark.parametrize(
+    "reducer",
+    [
+        "tuple",
+        "path",
+        "dot",
+        "underscore",
+        make_reducer("::", escape="\\"),
+        lambda k1, k2: k2 if k1 is None else "{}/{}".format(k1, k2),
+        lambda k1, k2, parent_obj: tuple_reducer(k1, (type(parent_obj), k2)),
+    ],
+)
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"inverse": True},
+        {"max_flatten_depth": 2},
+        {"keep_empty_types": (dict,)},
+    ],
+)
+def test_iter_flatten_matches_flatten(normal_dict, reducer, kwargs):
+    # `flatten()` keeps its own copy of the traversal for speed, so the two copies
+    # should stay in sync
+    d = dict(normal_dict, e={"a.b": {}, "c": "3"})
+    flat_dict = flatten(d, reducer=reducer, **kwargs)
+    assert list(_iter_flatten(d, reducer=reducer, **kwargs)) == list(flat_dict.items())
+
+
+class FormattedKey:
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return "FormattedKey({})".format(self.name)
+
+    def __format__(self, format_spec):
+        return self.name
+
+
+class StrEnumKey(str, Enum):
+    a = "x"
+
+
+@pytest.mark.parametrize("key", [FormattedKey("x"), StrEnumKey.a])
+def test_delimiter_reducer_formats_keys_like_dot_reducer(key):
+    # `format()` of a str-mixin `Enum` depends on the Python version
+    d = {"p": {key: 1, "q": {key: 2}}}
+    assert flatten(d, reducer="dot") == flatten(d, reducer=dot_reducer)
+    assert flatten(d, reducer="dot") == {
+        "p." + format(key): 1,
+        "p.q." + format(key): 2,
+    }
+
+
+def test_delimiter_reducer_with_escape_formats_keys():
+    reducer = make_reducer(".", escape="\\")
+    d = {"p": {FormattedKey("x"): 1, "q": {FormattedKey("y.z"): 2}}}
+    assert flatten(d, reducer=reducer) == {"p.x": 1, "p.q.y\\.z": 2}
+
+
+def test_delimiter_reducer_subclass_is_called(normal_dict):
+    class UpperDotReducer(DelimiterReducer):
+        def __call__(self, k1, k2):
+            return super().__call__(k1, k2.upper())
+
+    assert flatten(normal_dict, reducer=UpperDotReducer(".")) == {
+        key.upper(): value for key, value in flatten(normal_dict, "dot").items()
+    }
+
+
+def test_reducer_and_splitter_are_abstract():
+    class IncompleteReducer(Reducer):
+        pass
+
+    class IncompleteSplitter(Splitter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteReducer()
+    with pytest.raises(TypeError):
+        IncompleteSplitter()
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+# modules that `import flatten_dict` must not load eagerly
+HEAVY_MODULES = ("asyncio", "importlib.metadata", "inspect", "pathlib")
+
+
+def _run_python(code, *options):
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize("module", HEAVY_MODULES)
+def test_import_does_not_load_heavy_module(module):
+    result = _run_python(
+        "import sys, flatten_dict; print({!r} in sys.modules)".format(module)
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_import_time_excludes_heavy_modules():
+    # `-X importtime` lines: "import time: self [us] | cumulative | imported package"
+    result = _run_python("import flatten_dict", "-X", "importtime")
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        imported.add(line.rsplit("|", 1)[-1].strip())
+    assert "flatten_dict" in imported
+    assert imported.isdisjoint(HEAVY_MODULES)
+
+
+def test_lazy_attributes():
+    import flatten_dict
+    from flatten_dict.async_flatten_dict import aflatten, aunflatten
+
+    assert flatten_dict.aflatten is aflatten
+    assert flatten_dict.aunflatten is aunflatten
+    assert isinstance(flatten_dict.__version__, str)
+    assert {"aflatten", "aunflatten", "__version__"} <= set(dir(flatten_dict))
+    with pytest.raises(AttributeError):
+        flatten_dict.does_not_exist  # noqa: B018